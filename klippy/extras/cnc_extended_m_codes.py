@@ -67,6 +67,9 @@ class CNCMCodes:
         self.adaptive_feed_enabled = False
         self.feed_stop_enabled = False
         
+        # Cached get_status() result, cleared whenever the state above changes
+        self._status = None
+        
         # Modal state stack (for M70-M73)
         self.modal_state_stack = []
         
@@ -92,17 +95,13 @@ class CNCMCodes:
     
     def _handle_ready(self):
         """Initialize references to other printer objects"""
-        try:
-            self.pause_resume = self.printer.lookup_object('pause_resume')
-        except:
+        self.pause_resume = self.printer.lookup_object('pause_resume', None)
+        if self.pause_resume is None:
             logging.info("CNC M-Codes: pause_resume not available")
-            self.pause_resume = None
         
-        try:
-            self.toolhead = self.printer.lookup_object('toolhead')
-        except:
+        self.toolhead = self.printer.lookup_object('toolhead', None)
+        if self.toolhead is None:
             logging.info("CNC M-Codes: toolhead not available")
-            self.toolhead = None
     
     def _register_commands(self):
         """Register all M-Code commands"""
@@ -236,8 +235,9 @@ class CNCMCodes:
             'direction': 1,  # Clockwise
             'speed': speed
         }
+        self._status = None
         
-        logging.info(f"CNC M-Codes: M3 - Spindle CW at {speed} RPM")
+        logging.info("CNC M-Codes: M3 - Spindle CW at %s RPM", speed)
         gcmd.respond_info(f"M3: Spindle clockwise at S{speed}")
         
         # TODO: Connect to actual spindle control via HAL pins
@@ -253,8 +253,9 @@ class CNCMCodes:
             'direction': -1,  # Counter-clockwise
             'speed': speed
         }
+        self._status = None
         
-        logging.info(f"CNC M-Codes: M4 - Spindle CCW at {speed} RPM")
+        logging.info("CNC M-Codes: M4 - Spindle CCW at %s RPM", speed)
         gcmd.respond_info(f"M4: Spindle counter-clockwise at S{speed}")
     
     cmd_M5_help = "Spindle stop"
@@ -262,6 +263,7 @@ class CNCMCodes:
         """M5 - Stop spindle"""
         self.spindle_state['running'] = False
         self.spindle_state['direction'] = 0
+        self._status = None
         
         logging.info("CNC M-Codes: M5 - Spindle stop")
         gcmd.respond_info("M5: Spindle stopped")
@@ -273,7 +275,8 @@ class CNCMCodes:
         timeout = gcmd.get_float('Q', 5., minval=0.)
         direction = gcmd.get_int('P', 0, minval=0, maxval=2)
         
-        logging.info(f"CNC M-Codes: M19 - Orient spindle to {angle}° (timeout {timeout}s)")
+        logging.info("CNC M-Codes: M19 - Orient spindle to %s° (timeout %ss)",
+                     angle, timeout)
         gcmd.respond_info(f"M19: Spindle orientation to R{angle} degrees")
         
         # TODO: Implement spindle orientation with encoder feedback
@@ -287,6 +290,7 @@ class CNCMCodes:
     def cmd_M7(self, gcmd):
         """M7 - Turn on mist coolant"""
         self.coolant_mist = True
+        self._status = None
         logging.info("CNC M-Codes: M7 - Mist coolant ON")
         gcmd.respond_info("M7: Mist coolant ON")
     
@@ -294,6 +298,7 @@ class CNCMCodes:
     def cmd_M8(self, gcmd):
         """M8 - Turn on flood coolant"""
         self.coolant_flood = True
+        self._status = None
         logging.info("CNC M-Codes: M8 - Flood coolant ON")
         gcmd.respond_info("M8: Flood coolant ON")
     
@@ -302,6 +307,7 @@ class CNCMCodes:
         """M9 - Turn off all coolant"""
         self.coolant_mist = False
         self.coolant_flood = False
+        self._status = None
         logging.info("CNC M-Codes: M9 - All coolant OFF")
         gcmd.respond_info("M9: All coolant OFF")
     
@@ -314,6 +320,7 @@ class CNCMCodes:
         """M48 - Enable speed and feed override controls"""
         self.feed_override_enabled = True
         self.spindle_override_enabled = True
+        self._status = None
         logging.info("CNC M-Codes: M48 - Overrides enabled")
         gcmd.respond_info("M48: Speed and feed overrides ENABLED")
     
@@ -322,6 +329,7 @@ class CNCMCodes:
         """M49 - Disable speed and feed override controls"""
         self.feed_override_enabled = False
         self.spindle_override_enabled = False
+        self._status = None
         logging.info("CNC M-Codes: M49 - Overrides disabled")
         gcmd.respond_info("M49: Speed and feed overrides DISABLED")
     
@@ -330,9 +338,10 @@ class CNCMCodes:
         """M50 - Control feed override"""
         enable = gcmd.get_int('P', 1, minval=0, maxval=1)
         self.feed_override_enabled = bool(enable)
+        self._status = None
         
         status = "ENABLED" if self.feed_override_enabled else "DISABLED"
-        logging.info(f"CNC M-Codes: M50 P{enable} - Feed override {status}")
+        logging.info("CNC M-Codes: M50 P%s - Feed override %s", enable, status)
         gcmd.respond_info(f"M50: Feed override {status}")
     
     cmd_M51_help = "Spindle speed override control"
@@ -340,9 +349,11 @@ class CNCMCodes:
         """M51 - Control spindle speed override"""
         enable = gcmd.get_int('P', 1, minval=0, maxval=1)
         self.spindle_override_enabled = bool(enable)
+        self._status = None
         
         status = "ENABLED" if self.spindle_override_enabled else "DISABLED"
-        logging.info(f"CNC M-Codes: M51 P{enable} - Spindle override {status}")
+        logging.info("CNC M-Codes: M51 P%s - Spindle override %s",
+                     enable, status)
         gcmd.respond_info(f"M51: Spindle override {status}")
     
     cmd_M52_help = "Adaptive feed control"
@@ -350,9 +361,10 @@ class CNCMCodes:
         """M52 - Enable/disable adaptive feed"""
         enable = gcmd.get_int('P', 1, minval=0, maxval=1)
         self.adaptive_feed_enabled = bool(enable)
+        self._status = None
         
         status = "ENABLED" if self.adaptive_feed_enabled else "DISABLED"
-        logging.info(f"CNC M-Codes: M52 P{enable} - Adaptive feed {status}")
+        logging.info("CNC M-Codes: M52 P%s - Adaptive feed %s", enable, status)
         gcmd.respond_info(f"M52: Adaptive feed {status}")
     
     cmd_M53_help = "Feed stop control"
@@ -360,9 +372,10 @@ class CNCMCodes:
         """M53 - Enable/disable feed stop switch"""
         enable = gcmd.get_int('P', 1, minval=0, maxval=1)
         self.feed_stop_enabled = bool(enable)
+        self._status = None
         
         status = "ENABLED" if self.feed_stop_enabled else "DISABLED"
-        logging.info(f"CNC M-Codes: M53 P{enable} - Feed stop {status}")
+        logging.info("CNC M-Codes: M53 P%s - Feed stop %s", enable, status)
         gcmd.respond_info(f"M53: Feed stop {status}")
     
     # ========================================================================
@@ -385,13 +398,14 @@ class CNCMCodes:
         # Stop spindle first
         self.spindle_state['running'] = False
         self.spindle_state['direction'] = 0
+        self._status = None
         
         tool_number = gcmd.get_int('T', None)
         if tool_number is None:
             # Try to get from saved variable
             tool_number = 0  # Default if no T-word specified
         
-        logging.info(f"CNC M-Codes: M6 - Tool change to T{tool_number}")
+        logging.info("CNC M-Codes: M6 - Tool change to T%s", tool_number)
         gcmd.respond_info(f"M6: Tool change - Insert tool T{tool_number} and resume")
         
         # Pause for manual tool change
@@ -408,7 +422,7 @@ class CNCMCodes:
         """M61 - Set current tool number without tool change"""
         tool = gcmd.get_int('Q', minval=0)
         
-        logging.info(f"CNC M-Codes: M61 Q{tool} - Set current tool")
+        logging.info("CNC M-Codes: M61 Q%s - Set current tool", tool)
         gcmd.respond_info(f"M61: Current tool set to T{tool}")
         
         # Update tool tracking variable
@@ -426,7 +440,7 @@ class CNCMCodes:
         # Queue the output change for next motion command
         self.digital_output_queue.append({'pin': pin, 'value': True})
         
-        logging.info(f"CNC M-Codes: M62 P{pin} - Digital out ON (queued)")
+        logging.info("CNC M-Codes: M62 P%s - Digital out ON (queued)", pin)
         gcmd.respond_info(f"M62: Digital output {pin} ON (synchronized)")
     
     cmd_M63_help = "Digital output OFF, synchronized"
@@ -437,7 +451,8 @@ class CNCMCodes:
         # Queue the output change for next motion command
         self.digital_output_queue.append({'pin': pin, 'value': False})
         
-        logging.info(f"CNC M-Codes: M63 P{pin} - Digital out OFF (queued)")
+        logging.info("CNC M-Codes: M63 P%s - Digital out OFF (queued)",
+                     pin)
         gcmd.respond_info(f"M63: Digital output {pin} OFF (synchronized)")
     
     cmd_M64_help = "Digital output ON, immediate"
@@ -447,7 +462,8 @@ class CNCMCodes:
         
         self.digital_outputs[pin] = True
         
-        logging.info(f"CNC M-Codes: M64 P{pin} - Digital out ON (immediate)")
+        logging.info("CNC M-Codes: M64 P%s - Digital out ON (immediate)",
+                     pin)
         gcmd.respond_info(f"M64: Digital output {pin} ON (immediate)")
         
         # TODO: Set actual digital output pin via HAL or output_pin
@@ -459,7 +475,8 @@ class CNCMCodes:
         
         self.digital_outputs[pin] = False
         
-        logging.info(f"CNC M-Codes: M65 P{pin} - Digital out OFF (immediate)")
+        logging.info("CNC M-Codes: M65 P%s - Digital out OFF (immediate)",
+                     pin)
         gcmd.respond_info(f"M65: Digital output {pin} OFF (immediate)")
     
     cmd_M66_help = "Wait on input"
@@ -482,7 +499,8 @@ class CNCMCodes:
         mode_names = ["IMMEDIATE", "RISE", "FALL", "HIGH", "LOW"]
         mode_name = mode_names[mode] if mode < len(mode_names) else "UNKNOWN"
         
-        logging.info(f"CNC M-Codes: M66 - Wait on {pin_type} input {pin_num}, mode {mode_name}")
+        logging.info("CNC M-Codes: M66 - Wait on %s input %s, mode %s",
+                     pin_type, pin_num, mode_name)
         gcmd.respond_info(f"M66: Waiting on {pin_type} input {pin_num} (mode {mode_name}, timeout {timeout}s)")
         
         # TODO: Implement actual input monitoring with timeout
@@ -501,7 +519,8 @@ class CNCMCodes:
         # Queue the output change for next motion command
         self.analog_output_queue.append({'pin': pin, 'value': value})
         
-        logging.info(f"CNC M-Codes: M67 E{pin} Q{value} - Analog out (queued)")
+        logging.info("CNC M-Codes: M67 E%s Q%s - Analog out (queued)",
+                     pin, value)
         gcmd.respond_info(f"M67: Analog output {pin} = {value} (synchronized)")
     
     cmd_M68_help = "Analog output, immediate"
@@ -512,7 +531,8 @@ class CNCMCodes:
         
         self.analog_outputs[pin] = value
         
-        logging.info(f"CNC M-Codes: M68 E{pin} Q{value} - Analog out (immediate)")
+        logging.info("CNC M-Codes: M68 E%s Q%s - Analog out (immediate)",
+                     pin, value)
         gcmd.respond_info(f"M68: Analog output {pin} = {value} (immediate)")
         
         # TODO: Set actual analog output via PWM or DAC
@@ -535,7 +555,8 @@ class CNCMCodes:
         program = gcmd.get_int('P', minval=0)
         repeats = gcmd.get_int('L', 1, minval=1)
         
-        logging.info(f"CNC M-Codes: M98 P{program} L{repeats} - Call subroutine")
+        logging.info("CNC M-Codes: M98 P%s L%s - Call subroutine",
+                     program, repeats)
         
         # Convert to Klipper O-code call
         for i in range(repeats):
@@ -587,6 +608,7 @@ class CNCMCodes:
         self.spindle_override_enabled = state['spindle_override']
         self.adaptive_feed_enabled = state['adaptive_feed']
         self.feed_stop_enabled = state['feed_stop']
+        self._status = None
     
     cmd_M70_help = "Save modal state"
     def cmd_M70(self, gcmd):
@@ -656,9 +678,12 @@ class CNCMCodes:
         
         mcode_name = f"M{mcode_number}"
         
-        # Try to find shell_command integration
-        try:
-            shell_cmd = self.printer.lookup_object(f'shell_command {mcode_name.lower()}')
+        # Try to find shell_command integration, then gcode_macro as fallback
+        shell_cmd = self.printer.lookup_object(
+            f'shell_command {mcode_name.lower()}', None)
+        macro = self.printer.lookup_object(f'gcode_macro {mcode_name}', None)
+        
+        if shell_cmd is not None:
             # Execute shell command with parameters
             args = []
             if p_value is not None:
@@ -666,40 +691,42 @@ class CNCMCodes:
             if q_value is not None:
                 args.append(str(q_value))
             
-            logging.info(f"CNC M-Codes: {mcode_name} - Execute shell command with args {args}")
+            logging.info("CNC M-Codes: %s - Execute shell command with args %s",
+                         mcode_name, args)
             # shell_cmd.run_command(args)  # Would need shell_command support
             gcmd.respond_info(f"{mcode_name}: Shell command (configure via [shell_command {mcode_name.lower()}])")
-        except:
-            # Try gcode_macro as fallback
-            try:
-                macro = self.printer.lookup_object(f'gcode_macro {mcode_name}')
-                logging.info(f"CNC M-Codes: {mcode_name} - Execute macro")
-                # Call the macro
-                cmd_params = ""
-                if p_value is not None:
-                    cmd_params += f" P={p_value}"
-                if q_value is not None:
-                    cmd_params += f" Q={q_value}"
-                gcmd.respond_raw(f"{mcode_name}{cmd_params}")
-            except:
-                # No shell command or macro defined
-                logging.info(f"CNC M-Codes: {mcode_name} - Not configured")
-                gcmd.respond_info(f"{mcode_name}: Not configured (define [shell_command {mcode_name.lower()}] or [gcode_macro {mcode_name}])")
+        elif macro is not None:
+            logging.info("CNC M-Codes: %s - Execute macro", mcode_name)
+            # Call the macro
+            cmd_params = ""
+            if p_value is not None:
+                cmd_params += f" P={p_value}"
+            if q_value is not None:
+                cmd_params += f" Q={q_value}"
+            gcmd.respond_raw(f"{mcode_name}{cmd_params}")
+        else:
+            # No shell command or macro defined
+            logging.info("CNC M-Codes: %s - Not configured", mcode_name)
+            gcmd.respond_info(f"{mcode_name}: Not configured (define [shell_command {mcode_name.lower()}] or [gcode_macro {mcode_name}])")
     
     def get_status(self, eventtime):
         """Return status for queries"""
-        return {
-            'optional_stop_enabled': self.optional_stop_enabled,
-            'spindle_running': self.spindle_state['running'],
-            'spindle_direction': self.spindle_state['direction'],
-            'spindle_speed': self.spindle_state['speed'],
-            'coolant_mist': self.coolant_mist,
-            'coolant_flood': self.coolant_flood,
-            'feed_override_enabled': self.feed_override_enabled,
-            'spindle_override_enabled': self.spindle_override_enabled,
-            'adaptive_feed_enabled': self.adaptive_feed_enabled,
-            'feed_stop_enabled': self.feed_stop_enabled,
-        }
+        # Only rebuilt after a state change.  webhooks diffs successive
+        # results, so the cached dict is replaced rather than mutated.
+        if self._status is None:
+            self._status = {
+                'optional_stop_enabled': self.optional_stop_enabled,
+                'spindle_running': self.spindle_state['running'],
+                'spindle_direction': self.spindle_state['direction'],
+                'spindle_speed': self.spindle_state['speed'],
+                'coolant_mist': self.coolant_mist,
+                'coolant_flood': self.coolant_flood,
+                'feed_override_enabled': self.feed_override_enabled,
+                'spindle_override_enabled': self.spindle_override_enabled,
+                'adaptive_feed_enabled': self.adaptive_feed_enabled,
+                'feed_stop_enabled': self.feed_stop_enabled,
+            }
+        return self._status
 
 def load_config(config):
     return CNCMCodes(config)
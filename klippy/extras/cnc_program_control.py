@@ -8,6 +8,7 @@ class CNCProgramControl:
         self.printer = config.get_printer()
         self.gcode = self.printer.lookup_object('gcode')
         self.pause_resume = None
+        self.toolhead = None
         
         # Register M-Codes (override existing if needed)
         # M0, M1, M2 are CNC-specific
@@ -24,11 +25,10 @@ class CNCProgramControl:
         self.printer.register_event_handler("klippy:ready", self._handle_ready)
     
     def _handle_ready(self):
+        self.toolhead = self.printer.lookup_object('toolhead')
+        
         # Get pause_resume if available
-        try:
-            self.pause_resume = self.printer.lookup_object('pause_resume')
-        except:
-            self.pause_resume = None
+        self.pause_resume = self.printer.lookup_object('pause_resume', None)
     
     # M0 - Program Pause (Unconditional)
     cmd_M0_help = "Program pause (unconditional)"
@@ -47,8 +47,7 @@ class CNCProgramControl:
         - Resume via RESUME Befehl
         """
         # Finish all pending moves first
-        toolhead = self.printer.lookup_object('toolhead')
-        toolhead.wait_moves()
+        self.toolhead.wait_moves()
         
         # Pause the print/job
         if self.pause_resume is not None:
@@ -56,8 +55,9 @@ class CNCProgramControl:
             self.gcode.respond_info("M0: Program paused - Send RESUME to continue")
         else:
             # Fallback if pause_resume not available
-            self.gcode.respond_info("M0: Pause requested but pause_resume not configured")
-            self.gcode.respond_info("Add [pause_resume] to printer.cfg to enable M0/M1")
+            self.gcode.respond_info(
+                "M0: Pause requested but pause_resume not configured\n"
+                "Add [pause_resume] to printer.cfg to enable M0/M1")
     
     # M1 - Optional Program Pause
     cmd_M1_help = "Optional program pause (if enabled)"
@@ -111,8 +111,7 @@ class CNCProgramControl:
         restart_mode = 'RESTART' in params
         
         # Finish all pending moves
-        toolhead = self.printer.lookup_object('toolhead')
-        toolhead.wait_moves()
+        self.toolhead.wait_moves()
         
         # Reset G-Code state
         self._reset_gcode_state()
@@ -128,21 +127,17 @@ class CNCProgramControl:
             self.gcode.respond_info("M2 RESTART: Program end with reset - Ready for restart")
             
             # Signal completion for Moonraker auto-reset
-            try:
-                self.printer.send_event("virtual_sdcard:complete")
-            except:
-                pass  # Event might not be registered
+            # (send_event is a no-op if no handler is registered)
+            self.printer.send_event("virtual_sdcard:complete")
         else:
             # M2 - Standard Program End
             self.gcode.respond_info("M2: Program end - Ready for new program (MDI mode)")
     
     def _reset_gcode_state(self):
         """Reset G-Code state to defaults (like after M2/M2 RESTART)"""
-        # Reset to absolute mode (G90)
-        self.gcode.run_script_from_command("G90")
-        
-        # Reset to default coordinate system (G54)
-        self.gcode.run_script_from_command("G54")
+        # Reset to absolute mode (G90) and default coordinate system (G54)
+        # in a single dispatcher pass
+        self.gcode.run_script_from_command("G90\nG54")
         
         # Reset distance mode (G21 - metric)
         # Note: This is optional, depends on machine config
@@ -159,7 +154,7 @@ class CNCProgramControl:
         try:
             # Try to execute M5 if configured as macro
             self.gcode.run_script_from_command("M5")
-        except:
+        except self.printer.command_error:
             # Spindle control not configured, ignore
             pass
     
@@ -169,7 +164,7 @@ class CNCProgramControl:
         try:
             # Try to execute M9 if configured as macro
             self.gcode.run_script_from_command("M9")
-        except:
+        except self.printer.command_error:
             # Coolant control not configured, ignore
             pass
     